@@ -6,10 +6,12 @@ Single-page dashboard with key statistics and visualizations
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import pyarrow as pa
+from pyarrow import csv as pa_csv, dataset as pa_ds, parquet as pq
+from contextlib import contextmanager
 from pathlib import Path
+import os
+import time
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -20,401 +22,625 @@ st.set_page_config(
     layout="wide"
 )
 
+@st.cache_data
+def _load_css():
+    """Page CSS, read from styles.css once per process"""
+    css = Path(__file__).with_name('styles.css').read_text()
+    return f"<style>{css}</style>"
+
 # Simple CSS styling
-st.markdown("""
-<style>
-    /* Add gradient background to the entire app */
-    .stApp {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        background-attachment: fixed;
-    }
-    
-    /* Style the main content area */
-    .main > div {
-        background: rgba(255, 255, 255, 0.95);
-        padding: 2rem;
-        border-radius: 15px;
-        margin: 1rem;
-        box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
-        backdrop-filter: blur(10px);
-    }
-    
-    .main-header {
-        font-size: 2.5rem;
-        color: #1e3a8a;
-        text-align: center;
-        margin-bottom: 1.5rem;
-    }
-    .metric-card {
-        background: #f8fafc;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid #3b82f6;
-    }
-    
-    /* Style sidebar if present */
-    .css-1d391kg {
-        background: rgba(255, 255, 255, 0.9);
-        backdrop-filter: blur(10px);
-    }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(_load_css(), unsafe_allow_html=True)
 
-@st.cache_data
-def load_data():
-    """Load processed data"""
+# Figures only depend on the loaded DataFrames, so hash by content and let
+# Streamlit reuse the built figure objects across reruns instead of
+# re-serializing them on every widget interaction.
+_HASH_FUNCS = {
+    pd.DataFrame: lambda d: pd.util.hash_pandas_object(d, index=True).values.tobytes(),
+    pd.Series: lambda s: pd.util.hash_pandas_object(s, index=True).values.tobytes(),
+}
+
+# Columns the dashboard actually renders; everything else is pruned at
+# read time to keep the resident frames small.
+MARKET_COLS = [
+    'year',
+    'ai_software_revenue_in_billions',
+    'global_ai_market_value_in_billions',
+    'ai_adoption_%',
+    'organizations_using_ai',
+    'organizations_planning_to_implement_ai',
+    'global_expectation_for_ai_adoption_%',
+    'estimated_jobs_eliminated_by_ai_millions',
+    'estimated_new_jobs_created_by_ai_millions',
+    'organizations_believing_ai_provides_competitive_edge',
+    'companies_prioritizing_ai_in_strategy',
+    'estimated_revenue_increase_from_ai_trillions_usd',
+    'expected_increase_in_employee_productivity_due_to_ai_%',
+    'americans_using_voice_assistants_%',
+    'digital_voice_assistants_billions_of_devices',
+    'medical_professionals_using_ai_for_diagnosis',
+    'ai_contribution_to_healthcare_in_billions',
+    'marketers_believing_ai_improves_email_revenue',
+    'jobs_at_high_risk_of_automation__transportation_&_storage_%',
+    'jobs_at_high_risk_of_automation__wholesale_&_retail_trade',
+    'jobs_at_high_risk_of_automation__manufacturing',
+]
+POP_COLS = ['country', 'ai_and_ml_popularity']
+
+# Explicit column types skip the CSV reader's inference pass and store
+# the metrics at the precision the charts actually need.
+MARKET_TYPES = {c: pa.float32() for c in MARKET_COLS}
+MARKET_TYPES['year'] = pa.int16()
+POP_TYPES = {'country': pa.string(), 'ai_and_ml_popularity': pa.float32()}
+
+# Trimmed modebar and fixed sizing cut the per-chart JS mounting work
+# the browser does for each of the seven figures.
+PLOTLY_CONFIG = {
+    'displaylogo': False,
+    'modeBarButtonsToRemove': ['toImage', 'lasso2d', 'select2d'],
+    'responsive': False,
+}
+# The industry-risk chart is never interacted with; render it without
+# event handlers at all.
+STATIC_PLOTLY_CONFIG = dict(PLOTLY_CONFIG, staticPlot=True)
+
+# Set DASH_PROFILE=1 to show per-section timings in the sidebar. On the
+# current yearly data the app is render-bound (figure serialization and
+# chart mounting); data loads and aggregates are cached and near-zero
+# after the first rerun. Re-measure before optimizing further.
+PROFILE = os.getenv('DASH_PROFILE') == '1'
+
+@contextmanager
+def span(name):
+    """Time a block and report it in the sidebar when profiling"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if PROFILE:
+            st.sidebar.caption(f"{name}: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+def _import_go():
+    """Import plotly on first use, with the orjson JSON engine selected
+
+    orjson serializes numpy arrays in C instead of a Python-level loop,
+    which compounds across every figure sent to the browser.
+    """
+    import plotly.graph_objects as go
+    import plotly.io as pio
     try:
-        # Get project root directory
-        project_root = Path(__file__).parent.parent
-        
-        # Load processed data
-        processed_dir = project_root / 'data' / 'processed'
-        market_df = pd.read_csv(processed_dir / 'ai_market_clean.csv')
-        popularity_df = pd.read_csv(processed_dir / 'ai_popularity_clean.csv')
-        
-        return market_df, popularity_df
+        pio.json.config.default_engine = 'orjson'
+    except ValueError:
+        pass  # orjson not installed; keep plotly's default encoder
+    return go
+
+def _read_table(processed_dir, stem, columns=None, column_types=None):
+    """Read a processed table as an Arrow table, preferring Parquet over CSV"""
+    parquet_path = processed_dir / f'{stem}.parquet'
+    if parquet_path.exists():
+        return pq.read_table(parquet_path, columns=columns)
+
+    csv_format = pa_ds.CsvFileFormat(
+        convert_options=pa_csv.ConvertOptions(column_types=column_types))
+    dataset = pa_ds.dataset(processed_dir / f'{stem}.csv', format=csv_format)
+    # One-time conversion so later runs skip CSV parsing and type
+    # inference entirely. The Parquet copy keeps all columns and is
+    # written batch by batch, so the full table is never resident just
+    # to build the cache; pruning happens at materialization.
+    # Written to a sibling temp file and moved into place atomically so
+    # a process killed mid-write can never leave a truncated .parquet
+    # that later startups would prefer over the intact CSV.
+    tmp_path = parquet_path.with_suffix('.parquet.tmp')
+    try:
+        with pq.ParquetWriter(tmp_path, dataset.schema, compression='zstd') as writer:
+            for batch in dataset.to_batches():
+                writer.write_batch(batch)
+        os.replace(tmp_path, parquet_path)
+    except (OSError, pa.ArrowException):
+        tmp_path.unlink(missing_ok=True)
+    return dataset.to_table(columns=columns)
+
+_PROCESSED_DIR = Path(__file__).parent.parent / 'data' / 'processed'
+
+@st.cache_resource
+def load_market_data():
+    """Load the processed market table
+
+    Cached as a shared resource: the frame is materialized from Arrow
+    once per process and reused by every session without the per-hit
+    pickle/copy st.cache_data makes, so treat it as read-only.
+    """
+    try:
+        market_df = _read_table(_PROCESSED_DIR, 'ai_market_clean',
+                                columns=MARKET_COLS, column_types=MARKET_TYPES).to_pandas()
+        # Parquet caches written before the schema narrowed may still
+        # hold float64; downcast so every chart ships half the bytes.
+        for col in market_df.select_dtypes('float64').columns:
+            market_df[col] = market_df[col].astype('float32')
+        market_df['year'] = market_df['year'].astype('int16')
+        # Keep the frame sorted by year so first/latest rows are plain
+        # positional lookups instead of column scans.
+        return market_df.sort_values('year', ignore_index=True)
     except Exception as e:
-        st.error(f"Error loading data: {e}")
-        return None, None
+        st.error(f"Error loading market data: {e}")
+        return None
 
-def main():
-    # Header
-    st.markdown('<h1 class="main-header">📊 AI Market Intelligence Dashboard</h1>', unsafe_allow_html=True)
-    
-    # Load data
-    market_df, popularity_df = load_data()
-    
-    if market_df is None or popularity_df is None:
-        st.error("Failed to load data. Please check data files.")
-        return
-    
-    # Latest year data for metrics
-    latest_year = market_df['year'].max()
-    latest_data = market_df[market_df['year'] == latest_year].iloc[0]
-    first_data = market_df.iloc[0]
-    
-    # Section 1: Key Metrics
-    st.markdown("## 📈 Key Market Metrics")
-    
-    col1, col2, col3, col4, col5 = st.columns(5)
-    
-    with col1:
-        market_value = latest_data['global_ai_market_value_in_billions']
-        growth = ((market_value / first_data['global_ai_market_value_in_billions']) - 1) * 100
-        st.metric(
-            "Global AI Market",
-            f"${market_value:.0f}B",
-            delta=f"{growth:.0f}% growth"
-        )
-    
-    with col2:
-        revenue = latest_data['ai_software_revenue_in_billions']
-        revenue_growth = ((revenue / first_data['ai_software_revenue_in_billions']) - 1) * 100
-        st.metric(
-            "Software Revenue",
-            f"${revenue:.1f}B",
-            delta=f"{revenue_growth:.0f}% growth"
-        )
-    
-    with col3:
-        adoption = latest_data['ai_adoption_%']
-        adoption_change = adoption - first_data['ai_adoption_%']
-        st.metric(
-            "AI Adoption",
-            f"{adoption:.0f}%",
-            delta=f"+{adoption_change:.0f}pp"
-        )
-    
-    with col4:
-        jobs_created = latest_data['estimated_new_jobs_created_by_ai_millions']
-        jobs_eliminated = latest_data['estimated_jobs_eliminated_by_ai_millions']
-        net_jobs = jobs_created - jobs_eliminated
-        st.metric(
-            "Net Jobs Impact",
-            f"{net_jobs:+.1f}M",
-            delta="Created - Eliminated"
-        )
-    
-    with col5:
-        competitive = latest_data['organizations_believing_ai_provides_competitive_edge']
-        st.metric(
-            "Competitive Edge",
-            f"{competitive:.0f}%",
-            delta="Believe AI critical"
-        )
-    
-    # Section 2: Main Charts
-    st.markdown("## 📊 Market Trends")
-    
-    # Create subplots
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Market Value Growth
-        fig1 = go.Figure()
-        fig1.add_trace(go.Scatter(
-            x=market_df['year'],
-            y=market_df['global_ai_market_value_in_billions'],
-            mode='lines+markers',
-            name='Market Value',
-            line=dict(color='#3b82f6', width=3),
-            marker=dict(size=8)
-        ))
-        fig1.update_layout(
-            title="Global AI Market Value Growth",
-            xaxis_title="Year",
-            yaxis_title="Market Value (Billions USD)",
-            height=350,
-            showlegend=False,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
-        )
-        st.plotly_chart(fig1, use_container_width=True)
-    
-    with col2:
-        # Revenue Growth
-        fig2 = go.Figure()
-        fig2.add_trace(go.Scatter(
-            x=market_df['year'],
-            y=market_df['ai_software_revenue_in_billions'],
-            mode='lines+markers',
-            name='Revenue',
-            line=dict(color='#10b981', width=3),
-            marker=dict(size=8)
-        ))
-        fig2.update_layout(
-            title="AI Software Revenue Growth",
+@st.cache_resource
+def load_popularity_data():
+    """Load the processed popularity table (shared, read-only)
+
+    Parsed lazily: only the regional section reads this file, so pages
+    that never reach it skip the load entirely.
+    """
+    try:
+        popularity_df = _read_table(_PROCESSED_DIR, 'ai_popularity_clean',
+                                    columns=POP_COLS, column_types=POP_TYPES).to_pandas()
+        # Categorical country makes the regional group-by run on small
+        # integer codes instead of Python strings.
+        popularity_df['country'] = popularity_df['country'].astype('category')
+        return popularity_df
+    except Exception as e:
+        st.error(f"Error loading popularity data: {e}")
+        return None
+
+@st.cache_resource
+def _plotly_template():
+    """Register the dashboard's transparent layout template once
+
+    Figures reference the template by name instead of rebuilding the
+    same background/style dicts per figure.
+    """
+    go = _import_go()
+    import plotly.io as pio
+
+    tpl = go.layout.Template()
+    tpl.layout.plot_bgcolor = 'rgba(0,0,0,0)'
+    tpl.layout.paper_bgcolor = 'rgba(0,0,0,0)'
+    pio.templates['ai_dashboard'] = tpl
+    return 'ai_dashboard'
+
+# Plotly never ships more than this many points per trace; the yearly
+# series are tiny today, but the cap keeps payloads bounded as the
+# history grows.
+MAX_TRACE_POINTS = 2000
+
+def _lttb(x, y, n_out=MAX_TRACE_POINTS):
+    """Largest-Triangle-Three-Buckets downsampling
+
+    Picks the n_out visually significant points of a series, so long
+    histories plot with the same shape at a fraction of the payload.
+    """
+    n = len(x)
+    if n <= n_out:
+        return x, y
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    idx = np.zeros(n_out, dtype=np.intp)
+    idx[-1] = n - 1
+    bounds = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = bounds[i], bounds[i + 1]
+        nxt_hi = bounds[i + 2] if i + 2 <= n_out - 2 else n
+        avg_x = x[hi:nxt_hi].mean()
+        avg_y = y[hi:nxt_hi].mean()
+        # Largest triangle between the previous kept point, each bucket
+        # candidate and the next bucket's average.
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) -
+                      (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        idx[i + 1] = a
+    return x[idx], y[idx]
+
+def _line_fig(market_df, series, title, ylabel, showlegend=True, hovermode=None):
+    """Shared builder for the lines+markers time-series figures"""
+    go = _import_go()
+
+    fig = go.Figure()
+    with fig.batch_update():
+        for col, name, color, width, size in series:
+            xs, ys = _lttb(market_df['year'], market_df[col])
+            fig.add_trace(go.Scattergl(
+                x=xs,
+                y=ys,
+                mode='lines+markers',
+                name=name,
+                line=dict(color=color, width=width),
+                marker=dict(size=size) if size else None
+            ))
+        layout = dict(
+            title=title,
             xaxis_title="Year",
-            yaxis_title="Revenue (Billions USD)",
+            yaxis_title=ylabel,
             height=350,
-            showlegend=False,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
+            showlegend=showlegend,
+            template=_plotly_template()
         )
-        st.plotly_chart(fig2, use_container_width=True)
-    
-    # Section 3: Adoption and Impact
-    st.markdown("## 🚀 Adoption & Impact")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Adoption Rate
-        fig3 = go.Figure()
-        fig3.add_trace(go.Bar(
+        if hovermode:
+            layout['hovermode'] = hovermode
+        fig.update_layout(**layout)
+    return fig
+
+@st.cache_resource(hash_funcs=_HASH_FUNCS)
+def build_market_value_fig(market_df):
+    """Market value growth line chart"""
+    return _line_fig(
+        market_df,
+        [('global_ai_market_value_in_billions', 'Market Value', '#3b82f6', 3, 8)],
+        "Global AI Market Value Growth",
+        "Market Value (Billions USD)",
+        showlegend=False
+    )
+
+@st.cache_resource(hash_funcs=_HASH_FUNCS)
+def build_revenue_fig(market_df):
+    """Software revenue growth line chart"""
+    return _line_fig(
+        market_df,
+        [('ai_software_revenue_in_billions', 'Revenue', '#10b981', 3, 8)],
+        "AI Software Revenue Growth",
+        "Revenue (Billions USD)",
+        showlegend=False
+    )
+
+@st.cache_resource(hash_funcs=_HASH_FUNCS)
+def build_adoption_fig(market_df):
+    """Current vs expected adoption bar chart"""
+    go = _import_go()
+
+    fig = go.Figure()
+    # Commit all trace and layout changes in one pass instead of
+    # validating and relayouting per mutation.
+    with fig.batch_update():
+        fig.add_trace(go.Bar(
             x=market_df['year'],
             y=market_df['ai_adoption_%'],
             name='Current Adoption',
             marker_color='#3b82f6'
         ))
-        fig3.add_trace(go.Bar(
+        fig.add_trace(go.Bar(
             x=market_df['year'],
             y=market_df['global_expectation_for_ai_adoption_%'],
             name='Expected Adoption',
             marker_color='#93c5fd',
             opacity=0.7
         ))
-        fig3.update_layout(
+        fig.update_layout(
             title="AI Adoption: Current vs Expected",
             xaxis_title="Year",
             yaxis_title="Adoption Rate (%)",
             height=350,
             barmode='group',
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
+            template=_plotly_template()
         )
-        st.plotly_chart(fig3, use_container_width=True)
-    
-    with col2:
-        # Job Impact
-        fig4 = go.Figure()
-        fig4.add_trace(go.Scatter(
-            x=market_df['year'],
-            y=market_df['estimated_new_jobs_created_by_ai_millions'],
-            mode='lines+markers',
-            name='Jobs Created',
-            line=dict(color='#10b981', width=2),
-            marker=dict(size=6)
-        ))
-        fig4.add_trace(go.Scatter(
-            x=market_df['year'],
-            y=market_df['estimated_jobs_eliminated_by_ai_millions'],
-            mode='lines+markers',
-            name='Jobs Eliminated',
-            line=dict(color='#ef4444', width=2),
-            marker=dict(size=6)
-        ))
-        fig4.update_layout(
-            title="Employment Impact of AI",
-            xaxis_title="Year",
-            yaxis_title="Jobs (Millions)",
-            height=350,
-            hovermode='x unified',
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
+    return fig
+
+@st.cache_resource(hash_funcs=_HASH_FUNCS)
+def build_jobs_fig(market_df):
+    """Jobs created vs eliminated line chart"""
+    return _line_fig(
+        market_df,
+        [('estimated_new_jobs_created_by_ai_millions', 'Jobs Created', '#10b981', 2, 6),
+         ('estimated_jobs_eliminated_by_ai_millions', 'Jobs Eliminated', '#ef4444', 2, 6)],
+        "Employment Impact of AI",
+        "Jobs (Millions)",
+        hovermode='x unified'
+    )
+
+@st.cache_resource(hash_funcs=_HASH_FUNCS)
+def build_risk_fig(latest_data):
+    """Automation risk by industry bar chart"""
+    go = _import_go()
+
+    # Plain lists feed go.Bar directly; a three-row DataFrame (and the
+    # Plotly Express factory before it) is pure construction overhead.
+    industries = ['Transportation & Storage', 'Wholesale & Retail', 'Manufacturing']
+    risks = [
+        latest_data['jobs_at_high_risk_of_automation__transportation_&_storage_%'],
+        latest_data['jobs_at_high_risk_of_automation__wholesale_&_retail_trade'],
+        latest_data['jobs_at_high_risk_of_automation__manufacturing']
+    ]
+    fig = go.Figure(go.Bar(
+        x=risks,
+        y=industries,
+        orientation='h',
+        marker=dict(
+            color=risks,
+            colorscale='RdYlGn_r',
+            showscale=True,
+            colorbar=dict(title='Risk %')
         )
-        st.plotly_chart(fig4, use_container_width=True)
-    
-    # Section 4: Industry Analysis
+    ))
+    fig.update_layout(
+        title='Jobs at High Risk of Automation by Industry',
+        xaxis_title='Risk %',
+        yaxis_title='Industry',
+        height=350,
+        template=_plotly_template()
+    )
+    return fig
+
+@st.cache_resource(hash_funcs=_HASH_FUNCS)
+def build_strategic_fig(market_df):
+    """Strategic importance line chart"""
+    return _line_fig(
+        market_df,
+        [('organizations_believing_ai_provides_competitive_edge', 'See Competitive Edge', '#7c3aed', 2, None),
+         ('companies_prioritizing_ai_in_strategy', 'Prioritize in Strategy', '#ec4899', 2, None)],
+        "Strategic Importance of AI",
+        "Percentage of Companies (%)",
+        hovermode='x unified'
+    )
+
+@st.cache_data(hash_funcs=_HASH_FUNCS)
+def top_countries(popularity_df, n=20):
+    """Mean AI interest score for the top n countries"""
+    valid = popularity_df['country'].notna() & (popularity_df['country'] != '')
+    means = popularity_df.loc[valid].groupby(
+        'country', observed=True, sort=False)['ai_and_ml_popularity'].mean().dropna()
+    # O(n) partial selection of the top n; only the winners get sorted.
+    vals = means.to_numpy()
+    idx = np.argpartition(vals, -n)[-n:] if len(vals) > n else np.arange(len(vals))
+    idx = idx[np.argsort(vals[idx])[::-1]]
+    return pd.DataFrame({'country': means.index[idx], 'ai_and_ml_popularity': vals[idx]})
+
+@st.cache_resource(hash_funcs=_HASH_FUNCS)
+def build_country_fig(popularity_df):
+    """Top 20 countries by AI interest bar chart"""
+    go = _import_go()
+
+    country_interest = top_countries(popularity_df)
+
+    fig = go.Figure(go.Bar(
+        x=country_interest['ai_and_ml_popularity'],
+        y=country_interest['country'],
+        orientation='h',
+        marker=dict(
+            color=country_interest['ai_and_ml_popularity'],
+            colorscale='Viridis',
+            showscale=True,
+            colorbar=dict(title='Interest')
+        )
+    ))
+    fig.update_layout(
+        title='Top 20 Countries by AI Interest Score',
+        xaxis_title='AI Interest Score',
+        height=600,
+        yaxis={'title': 'Country', 'categoryorder': 'total ascending'},
+        template=_plotly_template()
+    )
+    return fig
+
+@st.cache_data(hash_funcs=_HASH_FUNCS)
+def compute_kpis(market_df):
+    """Precompute the headline metrics shown in the KPI cards"""
+    latest = market_df.iloc[-1]
+    first = market_df.iloc[0]
+    return {
+        'market_value': latest['global_ai_market_value_in_billions'],
+        'market_growth': ((latest['global_ai_market_value_in_billions'] /
+                           first['global_ai_market_value_in_billions']) - 1) * 100,
+        'revenue': latest['ai_software_revenue_in_billions'],
+        'revenue_growth': ((latest['ai_software_revenue_in_billions'] /
+                            first['ai_software_revenue_in_billions']) - 1) * 100,
+        'adoption': latest['ai_adoption_%'],
+        'adoption_change': latest['ai_adoption_%'] - first['ai_adoption_%'],
+        'net_jobs': (latest['estimated_new_jobs_created_by_ai_millions'] -
+                     latest['estimated_jobs_eliminated_by_ai_millions']),
+        'competitive': latest['organizations_believing_ai_provides_competitive_edge'],
+    }
+
+@st.cache_data(hash_funcs=_HASH_FUNCS)
+def compute_cagrs(market_df):
+    """Market and revenue CAGR plus their first/latest values"""
+    latest = market_df.iloc[-1]
+    first = market_df.iloc[0]
+    first_vals = np.array([first['global_ai_market_value_in_billions'],
+                           first['ai_software_revenue_in_billions']], dtype=np.float64)
+    latest_vals = np.array([latest['global_ai_market_value_in_billions'],
+                            latest['ai_software_revenue_in_billions']], dtype=np.float64)
+    years = len(market_df)
+    # One vectorized exponentiation covers both series.
+    market_cagr, revenue_cagr = ((latest_vals / first_vals) ** (1 / years) - 1) * 100
+    return {
+        'market_cagr': market_cagr,
+        'revenue_cagr': revenue_cagr,
+        'market_first': first_vals[0],
+        'market_latest': latest_vals[0],
+        'revenue_first': first_vals[1],
+        'revenue_latest': latest_vals[1],
+    }
+
+# Charts served through the cached-JSON/CDN path.
+_CDN_FIG_BUILDERS = {
+    'market_value': build_market_value_fig,
+    'revenue': build_revenue_fig,
+}
+
+@st.cache_data(hash_funcs=_HASH_FUNCS)
+def fig_cdn_html(name, market_df, height=350):
+    """Figure pre-serialized to JSON and rendered client-side via Plotly.react
+
+    The JSON string is built once per data version; subsequent reruns
+    echo the cached string and the browser diff-updates the existing
+    chart DOM instead of remounting it.
+    """
+    import json
+    import plotly.io as pio
+    from plotly.offline import get_plotlyjs_version
+
+    fig = _CDN_FIG_BUILDERS[name](market_df)
+    spec = pio.to_json(fig)
+    config = json.dumps(PLOTLY_CONFIG)
+    # The CDN bundle must match the plotly.js the installed plotly.py
+    # serializes for, so the version is derived rather than hard-coded.
+    plotlyjs = f'https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js'
+    return (
+        f'<div id="{name}" style="width:100%;height:{height}px"></div>\n'
+        f'<script src="{plotlyjs}"></script>\n'
+        f'<script>var spec = {spec};\n'
+        f'Plotly.react("{name}", spec.data, spec.layout, {config});</script>'
+    )
+
+@st.fragment
+def render_metrics(kpis):
+    """Key metric cards"""
+    st.markdown("## 📈 Key Market Metrics")
+
+    metrics = [
+        ("Global AI Market", f"${kpis['market_value']:.0f}B", f"{kpis['market_growth']:.0f}% growth"),
+        ("Software Revenue", f"${kpis['revenue']:.1f}B", f"{kpis['revenue_growth']:.0f}% growth"),
+        ("AI Adoption", f"{kpis['adoption']:.0f}%", f"+{kpis['adoption_change']:.0f}pp"),
+        ("Net Jobs Impact", f"{kpis['net_jobs']:+.1f}M", "Created - Eliminated"),
+        ("Competitive Edge", f"{kpis['competitive']:.0f}%", "Believe AI critical"),
+    ]
+    for col, (label, value, delta) in zip(st.columns(len(metrics)), metrics):
+        col.metric(label, value, delta=delta)
+
+def _embed_html(html, height):
+    """Render a raw HTML snippet in a sandboxed iframe
+
+    Prefers st.iframe; components.v1.html is deprecated and slated for
+    removal after 2026-06-01, but remains the fallback for Streamlit
+    versions that predate the replacement.
+    """
+    if hasattr(st, 'iframe'):
+        st.iframe(html, height=height)
+    else:
+        import streamlit.components.v1 as components
+        components.html(html, height=height)
+
+@st.fragment
+def render_market_trends(market_df):
+    """Market value and revenue growth charts"""
+    st.markdown("## 📊 Market Trends")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        _embed_html(fig_cdn_html('market_value', market_df), height=360)
+
+    with col2:
+        _embed_html(fig_cdn_html('revenue', market_df), height=360)
+
+@st.fragment
+def render_adoption(market_df):
+    """Adoption and employment impact charts"""
+    st.markdown("## 🚀 Adoption & Impact")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.plotly_chart(build_adoption_fig(market_df), use_container_width=True,
+                        config=PLOTLY_CONFIG)
+
+    with col2:
+        st.plotly_chart(build_jobs_fig(market_df), use_container_width=True,
+                        config=PLOTLY_CONFIG)
+
+@st.cache_data(hash_funcs=_HASH_FUNCS)
+def risk_chart_png(latest_data):
+    """Industry risk chart exported once as a PNG via kaleido
+
+    A ~20 KB PNG replaces the interactive JSON payload and WebGL init
+    for a panel that never changes within a session.
+    """
+    fig = build_risk_fig(latest_data)
+    return fig.to_image(format='png', width=700, height=350)
+
+@st.fragment
+def render_industry(market_df, latest_data):
+    """Industry risk and strategic importance charts"""
     st.markdown("## 🏭 Industry Risk Analysis")
-    
+
     col1, col2 = st.columns(2)
-    
+
     with col1:
-        # Automation Risk by Industry
-        risk_data = {
-            'Industry': ['Transportation & Storage', 'Wholesale & Retail', 'Manufacturing'],
-            'Risk %': [
-                latest_data['jobs_at_high_risk_of_automation__transportation_&_storage_%'],
-                latest_data['jobs_at_high_risk_of_automation__wholesale_&_retail_trade'],
-                latest_data['jobs_at_high_risk_of_automation__manufacturing']
-            ]
-        }
-        risk_df = pd.DataFrame(risk_data)
-        
-        fig5 = px.bar(
-            risk_df,
-            x='Risk %',
-            y='Industry',
-            orientation='h',
-            title='Jobs at High Risk of Automation by Industry',
-            color='Risk %',
-            color_continuous_scale='RdYlGn_r'
-        )
-        fig5.update_layout(
-            height=350,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
-        )
-        st.plotly_chart(fig5, use_container_width=True)
-    
+        try:
+            st.image(risk_chart_png(latest_data), use_container_width=True)
+        except Exception:
+            # kaleido missing or unable to render (no export engine,
+            # removed kwarg, sandboxed browser); fall back to a static
+            # Plotly chart rather than aborting the section.
+            st.plotly_chart(build_risk_fig(latest_data), use_container_width=True,
+                            config=STATIC_PLOTLY_CONFIG)
+
     with col2:
-        # Strategic Importance
-        strategic_data = pd.DataFrame({
-            'Year': market_df['year'],
-            'Competitive Edge': market_df['organizations_believing_ai_provides_competitive_edge'],
-            'Strategic Priority': market_df['companies_prioritizing_ai_in_strategy']
-        })
-        
-        fig6 = go.Figure()
-        fig6.add_trace(go.Scatter(
-            x=strategic_data['Year'],
-            y=strategic_data['Competitive Edge'],
-            mode='lines+markers',
-            name='See Competitive Edge',
-            line=dict(color='#7c3aed', width=2)
-        ))
-        fig6.add_trace(go.Scatter(
-            x=strategic_data['Year'],
-            y=strategic_data['Strategic Priority'],
-            mode='lines+markers',
-            name='Prioritize in Strategy',
-            line=dict(color='#ec4899', width=2)
-        ))
-        fig6.update_layout(
-            title="Strategic Importance of AI",
-            xaxis_title="Year",
-            yaxis_title="Percentage of Companies (%)",
-            height=350,
-            hovermode='x unified',
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
-        )
-        st.plotly_chart(fig6, use_container_width=True)
-    
-    # Section 5: Regional Analysis (if popularity data is available)
-    if 'country' in popularity_df.columns:
-        st.markdown("## 🌍 Global AI Interest")
-        
-        # Get top 20 countries by AI interest (filter out empty countries and use ai_and_ml_popularity)
-        country_interest = popularity_df[popularity_df['country'].notna() & (popularity_df['country'] != '')].copy()
-        country_interest = country_interest.groupby('country')['ai_and_ml_popularity'].mean().reset_index()
-        country_interest = country_interest.sort_values('ai_and_ml_popularity', ascending=False).head(20)
-        
-        fig7 = px.bar(
-            country_interest,
-            x='ai_and_ml_popularity',
-            y='country',
-            orientation='h',
-            title='Top 20 Countries by AI Interest Score',
-            color='ai_and_ml_popularity',
-            color_continuous_scale='Viridis'
-        )
-        fig7.update_layout(
-            height=600,
-            yaxis={'categoryorder': 'total ascending'},
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
-        )
-        st.plotly_chart(fig7, use_container_width=True)
-    
-    # Section 6: Future Projections
+        st.plotly_chart(build_strategic_fig(market_df), use_container_width=True,
+                        config=PLOTLY_CONFIG)
+
+@st.fragment
+def render_regional():
+    """Global AI interest chart"""
+    popularity_df = load_popularity_data()
+    if popularity_df is None or 'country' not in popularity_df.columns:
+        return
+    st.markdown("## 🌍 Global AI Interest")
+    st.plotly_chart(build_country_fig(popularity_df), use_container_width=True,
+                    config=PLOTLY_CONFIG)
+
+@st.fragment
+def render_projections(cagrs, latest_data):
+    """CAGR projections and expected impact"""
     st.markdown("## 🔮 Market Projections")
-    
+
     col1, col2, col3 = st.columns(3)
-    
+
     with col1:
-        # Calculate CAGR
-        years = len(market_df)
-        market_cagr = ((latest_data['global_ai_market_value_in_billions'] / 
-                       first_data['global_ai_market_value_in_billions']) ** (1/years) - 1) * 100
-        
         st.info(f"""
         **Market CAGR**  
-        {market_cagr:.1f}% annual growth
-        
-        **From ${first_data['global_ai_market_value_in_billions']:.0f}B to ${latest_data['global_ai_market_value_in_billions']:.0f}B**
+        {cagrs['market_cagr']:.1f}% annual growth
+
+        **From ${cagrs['market_first']:.0f}B to ${cagrs['market_latest']:.0f}B**
         """)
-    
+
     with col2:
-        revenue_cagr = ((latest_data['ai_software_revenue_in_billions'] / 
-                        first_data['ai_software_revenue_in_billions']) ** (1/years) - 1) * 100
-        
         st.success(f"""
         **Revenue CAGR**  
-        {revenue_cagr:.1f}% annual growth
-        
-        **From ${first_data['ai_software_revenue_in_billions']:.1f}B to ${latest_data['ai_software_revenue_in_billions']:.1f}B**
+        {cagrs['revenue_cagr']:.1f}% annual growth
+
+        **From ${cagrs['revenue_first']:.1f}B to ${cagrs['revenue_latest']:.1f}B**
         """)
-    
+
     with col3:
         productivity_gain = latest_data['expected_increase_in_employee_productivity_due_to_ai_%']
         revenue_increase = latest_data['estimated_revenue_increase_from_ai_trillions_usd']
-        
+
         st.warning(f"""
         **Expected Impact**  
         {productivity_gain:.0f}% productivity gain
-        
+
         **${revenue_increase:.1f}T revenue increase**
         """)
-    
-    # Footer statistics
-    st.markdown("---")
-    st.markdown("### 📊 Quick Statistics")
-    
+
+@st.fragment
+def render_footer(latest_data):
+    """Quick statistics footer"""
+    st.markdown("---\n### 📊 Quick Statistics")
+
     col1, col2, col3, col4 = st.columns(4)
-    
+
     with col1:
         st.markdown(f"""
         **Voice Assistants**  
         {latest_data['americans_using_voice_assistants_%']:.0f}% Americans use them  
         {latest_data['digital_voice_assistants_billions_of_devices']:.1f}B devices globally
         """)
-    
+
     with col2:
         st.markdown(f"""
         **Healthcare AI**  
         {latest_data['medical_professionals_using_ai_for_diagnosis']:.0f}% use AI for diagnosis  
         ${latest_data['ai_contribution_to_healthcare_in_billions']:.0f}B market value
         """)
-    
+
     with col3:
         st.markdown(f"""
         **Organizations**  
         {latest_data['organizations_using_ai']:.0f}% using AI  
         {latest_data['organizations_planning_to_implement_ai']:.0f}% planning to implement
         """)
-    
+
     with col4:
         st.markdown(f"""
         **Marketing Impact**  
@@ -422,5 +648,39 @@ def main():
         Email marketing boost
         """)
 
+def main():
+    # Header
+    st.markdown('<h1 class="main-header">📊 AI Market Intelligence Dashboard</h1>', unsafe_allow_html=True)
+
+    # Load data (the popularity table loads lazily in its section)
+    with span('load_data'):
+        market_df = load_market_data()
+
+    if market_df is None:
+        st.error("Failed to load data. Please check data files.")
+        return
+
+    # Latest year data for metrics, as a plain dict: the sections below
+    # do ~20 field lookups per rerun, and dict access skips the pandas
+    # Index hashing a Series __getitem__ pays each time.
+    latest_data = market_df.iloc[-1].to_dict()
+
+    # Each section is a fragment, so a widget interaction inside one
+    # section reruns only that section instead of the whole script.
+    with span('metrics'):
+        render_metrics(compute_kpis(market_df))
+    with span('market_trends'):
+        render_market_trends(market_df)
+    with span('adoption'):
+        render_adoption(market_df)
+    with span('industry'):
+        render_industry(market_df, latest_data)
+    with span('regional'):
+        render_regional()
+    with span('projections'):
+        render_projections(compute_cagrs(market_df), latest_data)
+    with span('footer'):
+        render_footer(latest_data)
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()